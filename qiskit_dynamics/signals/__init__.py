@@ -42,5 +42,39 @@ Transfer Functions
    Convolution
 """
 
-from .signals import Signal, DiscreteSignal, SignalSum, DiscreteSignalSum, SignalList
-from .transfer_functions import Convolution, Sampler, IQMixer
+import importlib as _importlib
+import sys as _sys
+
+# public names and the submodule defining each; these are imported on first access
+_LAZY = {
+    "Signal": ".signals",
+    "DiscreteSignal": ".signals",
+    "SignalSum": ".signals",
+    "DiscreteSignalSum": ".signals",
+    "SignalList": ".signals",
+    "Convolution": ".transfer_functions",
+    "Sampler": ".transfer_functions",
+    "IQMixer": ".transfer_functions",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# module level __getattr__ is only supported from python 3.7 on
+if _sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
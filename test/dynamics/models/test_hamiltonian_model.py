@@ -13,33 +13,74 @@
 
 """tests for qiskit_dynamics.models.HamiltonianModel"""
 
+from functools import lru_cache
+
 import numpy as np
 
-from scipy.linalg import expm
 from qiskit.quantum_info.operators import Operator
 from qiskit_dynamics.models import HamiltonianModel
 from qiskit_dynamics.signals import Signal, SignalList
 from qiskit_dynamics.dispatch import Array
 from ..common import QiskitDynamicsTestCase, TestJaxBase
 
+# Pauli matrices, checked against qiskit in test_pauli_constants
+_X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+_Y = np.array([[0.0, -1j], [1j, 0.0]], dtype=complex)
+_Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+
+@lru_cache(maxsize=64)
+def _cached_eigh(op_bytes, shape, dtype_str):
+    """Eigendecomposition of a Hermitian operator given by its raw bytes, shape, and dtype."""
+    w, V = np.linalg.eigh(np.frombuffer(op_bytes, dtype=dtype_str).reshape(shape))
+    # cached values are shared between calls, so make them read-only
+    w.setflags(write=False)
+    V.setflags(write=False)
+    return w, V
+
+
+def _hermitian_expm(H, t):
+    """Compute expm(1j * H * t) for a Hermitian H from its (cached) eigendecomposition."""
+    H = np.ascontiguousarray(H)
+    w, V = _cached_eigh(H.tobytes(), H.shape, H.dtype.str)
+    return (V * np.exp(1j * w * t)) @ V.conj().transpose()
+
+
+def _expm_diag(d, t):
+    """Compute expm(1j * diag(d) * t) for a real vector d."""
+    return np.diag(np.exp(1j * d * t))
+
 
 class TestHamiltonianModel(QiskitDynamicsTestCase):
     """Tests for HamiltonianModel."""
 
-    def setUp(self):
-        self.X = Array(Operator.from_label("X").data)
-        self.Y = Array(Operator.from_label("Y").data)
-        self.Z = Array(Operator.from_label("Z").data)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.X = Array(_X)
+        cls.Y = Array(_Y)
+        cls.Z = Array(_Z)
 
         # define a basic hamiltonian
         w = 2.0
         r = 0.5
-        operators = [2 * np.pi * self.Z / 2, 2 * np.pi * r * self.X / 2]
+        operators = [2 * np.pi * cls.Z / 2, 2 * np.pi * r * cls.X / 2]
         signals = [w, Signal(1.0, w)]
 
-        self.w = w
-        self.r = r
-        self.basic_hamiltonian = HamiltonianModel(operators=operators, signals=signals)
+        cls.w = w
+        cls.r = r
+        cls._basic_hamiltonian_template = HamiltonianModel(operators=operators, signals=signals)
+
+    def setUp(self):
+        # tests may set the rotating frame, so work on a copy of the template
+        self.basic_hamiltonian = self._basic_hamiltonian_template.copy()
+
+    def test_pauli_constants(self):
+        """Test the module level Pauli operators against qiskit."""
+        self.assertAllClose(self.X, Operator.from_label("X").data)
+        self.assertAllClose(self.Y, Operator.from_label("Y").data)
+        self.assertAllClose(self.Z, Operator.from_label("Z").data)
 
     def _basic_frame_evaluate_test(self, frame_operator, t):
         """Routine for testing setting of valid frame operators using
@@ -60,23 +101,25 @@ class TestHamiltonianModel(QiskitDynamicsTestCase):
         # convert to 2d array
         if isinstance(frame_operator, Operator):
             frame_operator = Array(frame_operator.data)
+        # frame is F=-1j * H, and need to compute exp(-F * t)
         if isinstance(frame_operator, Array) and frame_operator.ndim == 1:
+            U = _expm_diag(frame_operator, t)
             frame_operator = np.diag(frame_operator)
+        else:
+            U = _hermitian_expm(frame_operator, t)
 
         value = self.basic_hamiltonian(t) / -1j
 
         twopi = 2 * np.pi
 
-        # frame is F=-1j * H, and need to compute exp(-F * t)
-        U = expm(1j * np.array(frame_operator) * t)
-
         # drive coefficient
         d_coeff = self.r * np.cos(2 * np.pi * self.w * t)
 
         # manually evaluate frame
         expected = (
-            twopi * self.w * U @ self.Z.data @ U.conj().transpose() / 2
-            + d_coeff * twopi * U @ self.X.data @ U.conj().transpose() / 2
+            U
+            @ (twopi * self.w * self.Z.data / 2 + d_coeff * twopi * self.X.data / 2)
+            @ U.conj().transpose()
             - frame_operator
         )
 
@@ -118,14 +161,15 @@ class TestHamiltonianModel(QiskitDynamicsTestCase):
 
         # get the frame basis used in model. Note that the Frame object
         # orders the basis according to the ordering of eigh
-        _, U = np.linalg.eigh(frame_op)
+        w, U = np.linalg.eigh(frame_op)
 
         t = 3.21412
         value = self.basic_hamiltonian(t, in_frame_basis=True) / -1j
 
         # compose the frame basis transformation with the exponential
-        # frame rotation (this will be multiplied on the right)
-        U = expm(-1j * frame_op * t) @ U
+        # frame rotation (this will be multiplied on the right);
+        # expm(-1j * frame_op * t) @ U is U @ diag(exp(-1j * w * t))
+        U = U * np.exp(-1j * w * t)
         Uadj = U.conj().transpose()
 
         twopi = 2 * np.pi
@@ -141,47 +185,38 @@ class TestHamiltonianModel(QiskitDynamicsTestCase):
     def test_evaluate_pseudorandom(self):
         """Test evaluate with pseudorandom inputs."""
 
-        rng = np.random.default_rng(30493)
-        num_terms = 3
-        dim = 5
-        b = 1.0  # bound on size of random terms
-
-        # random hermitian frame operator
-        rand_op = rng.uniform(low=-b, high=b, size=(dim, dim)) + 1j * rng.uniform(
-            low=-b, high=b, size=(dim, dim)
-        )
-        frame_op = Array(rand_op + rand_op.conj().transpose())
+        # (seed, num_terms, dim) for each case
+        cases = [(30493, 3, 5), (94818, 5, 10)]
+        for seed, num_terms, dim in cases:
+            self._test_evaluate(*self._pseudorandom_inputs(seed, num_terms, dim))
 
-        # random hermitian operators
-        randoperators = rng.uniform(low=-b, high=b, size=(num_terms, dim, dim)) + 1j * rng.uniform(
-            low=-b, high=b, size=(num_terms, dim, dim)
-        )
-        randoperators = Array(randoperators + randoperators.conj().transpose([0, 2, 1]))
+    def _pseudorandom_inputs(self, seed, num_terms, dim):
+        """Generate pseudorandom arguments for _test_evaluate.
 
-        rand_coeffs = rng.uniform(low=-b, high=b, size=(num_terms)) + 1j * rng.uniform(
-            low=-b, high=b, size=(num_terms)
-        )
-        rand_carriers = Array(rng.uniform(low=-b, high=b, size=(num_terms)))
-        rand_phases = Array(rng.uniform(low=-b, high=b, size=(num_terms)))
+        Args:
+            seed (int): seed for the random number generator
+            num_terms (int): number of operators/signals
+            dim (int): dimension of the operators
 
-        self._test_evaluate(frame_op, randoperators, rand_coeffs, rand_carriers, rand_phases)
+        Returns:
+            tuple: frame operator, operators, coefficients, carriers, and phases
+        """
 
-        rng = np.random.default_rng(94818)
-        num_terms = 5
-        dim = 10
+        rng = np.random.default_rng(seed)
         b = 1.0  # bound on size of random terms
 
         # random hermitian frame operator
         rand_op = rng.uniform(low=-b, high=b, size=(dim, dim)) + 1j * rng.uniform(
             low=-b, high=b, size=(dim, dim)
         )
-        frame_op = Array(rand_op + rand_op.conj().transpose())
+        frame_op = Array(rand_op + rand_op.conj().T)
 
         # random hermitian operators
         randoperators = rng.uniform(low=-b, high=b, size=(num_terms, dim, dim)) + 1j * rng.uniform(
             low=-b, high=b, size=(num_terms, dim, dim)
         )
-        randoperators = Array(randoperators + randoperators.conj().transpose([0, 2, 1]))
+        randoperators += randoperators.conj().swapaxes(-1, -2)
+        randoperators = Array(randoperators)
 
         rand_coeffs = rng.uniform(low=-b, high=b, size=(num_terms)) + 1j * rng.uniform(
             low=-b, high=b, size=(num_terms)
@@ -189,32 +224,25 @@ class TestHamiltonianModel(QiskitDynamicsTestCase):
         rand_carriers = Array(rng.uniform(low=-b, high=b, size=(num_terms)))
         rand_phases = Array(rng.uniform(low=-b, high=b, size=(num_terms)))
 
-        self._test_evaluate(frame_op, randoperators, rand_coeffs, rand_carriers, rand_phases)
+        return frame_op, randoperators, rand_coeffs, rand_carriers, rand_phases
 
     def _test_evaluate(self, frame_op, operators, coefficients, carriers, phases):
 
-        sig_list = []
-        for coeff, freq, phase in zip(coefficients, carriers, phases):
-
-            def get_env_func(coeff=coeff):
-                # pylint: disable=unused-argument
-                def env(t):
-                    return coeff
-
-                return env
-
-            sig_list.append(Signal(get_env_func(), freq, phase))
-        sig_list = SignalList(sig_list)
+        # constant envelopes can be passed directly, without wrapping them in functions
+        sig_list = SignalList(
+            [
+                Signal(complex(coeff), freq, phase)
+                for coeff, freq, phase in zip(coefficients, carriers, phases)
+            ]
+        )
         model = HamiltonianModel(operators, drift=None, signals=sig_list, rotating_frame=frame_op)
 
         value = model(1.0, in_frame_basis=False) / -1j
         coeffs = np.real(coefficients * np.exp(1j * 2 * np.pi * carriers * 1.0 + 1j * phases))
-        expected = (
-            expm(1j * np.array(frame_op))
-            @ np.tensordot(coeffs, operators, axes=1)
-            @ expm(-1j * np.array(frame_op))
-            - frame_op
-        )
+
+        # 1j * frame_op is anti-Hermitian, so expm(-1j * frame_op) is the adjoint of U
+        U = _hermitian_expm(frame_op, 1.0)
+        expected = U @ np.einsum("t,tij->ij", coeffs, operators) @ U.conj().transpose() - frame_op
         self.assertAllClose(model._signals(1), coeffs)
         self.assertAllClose(model.get_operators(), operators)
 
@@ -227,30 +255,27 @@ class TestHamiltonianModelJax(TestHamiltonianModel, TestJaxBase):
     Note: This class has contains more tests due to inheritance.
     """
 
-    def test_jitable_funcs(self):
-        """Tests whether all functions are jitable.
-        Checks if having a frame makes a difference, as well as
-        all jax-compatible evaluation_modes."""
-        self.jit_wrap(self.basic_hamiltonian.evaluate)(1)
-        self.jit_wrap(self.basic_hamiltonian.evaluate_rhs)(1, Array(np.array([0.2, 0.4])))
-
-        self.basic_hamiltonian.rotating_frame = Array(np.array([[3j, 2j], [2j, 0]]))
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
 
-        self.jit_wrap(self.basic_hamiltonian.evaluate)(1)
-        self.jit_wrap(self.basic_hamiltonian.evaluate_rhs)(1, Array(np.array([0.2, 0.4])))
-
-        self.basic_hamiltonian.rotating_frame = None
+        cls.frame_mat = Array(np.array([[3j, 2j], [2j, 0]]))
+        cls.y_vec = Array(np.array([0.2, 0.4]))
 
-    def test_gradable_funcs(self):
-        """Tests whether all functions are gradable.
+    def test_jitable_and_gradable_funcs(self):
+        """Tests whether all functions are jitable and gradable.
         Checks if having a frame makes a difference, as well as
         all jax-compatible evaluation_modes."""
-        self.jit_grad_wrap(self.basic_hamiltonian.evaluate)(1.0)
-        self.jit_grad_wrap(self.basic_hamiltonian.evaluate_rhs)(1.0, Array(np.array([0.2, 0.4])))
+        self._jit_and_grad_funcs()
 
-        self.basic_hamiltonian.rotating_frame = Array(np.array([[3j, 2j], [2j, 0]]))
+        # the frame is captured as a constant when tracing, so each frame needs its own trace
+        self.basic_hamiltonian.rotating_frame = self.frame_mat
+        self._jit_and_grad_funcs()
 
-        self.jit_grad_wrap(self.basic_hamiltonian.evaluate)(1.0)
-        self.jit_grad_wrap(self.basic_hamiltonian.evaluate_rhs)(1.0, Array(np.array([0.2, 0.4])))
+    def _jit_and_grad_funcs(self):
+        """Jit and grad evaluate and evaluate_rhs of basic_hamiltonian in its current frame."""
+        self.jit_wrap(self.basic_hamiltonian.evaluate)(1)
+        self.jit_wrap(self.basic_hamiltonian.evaluate_rhs)(1, self.y_vec)
 
-        self.basic_hamiltonian.rotating_frame = None
+        self.jit_grad_wrap(self.basic_hamiltonian.evaluate)(1.0)
+        self.jit_grad_wrap(self.basic_hamiltonian.evaluate_rhs)(1.0, self.y_vec)
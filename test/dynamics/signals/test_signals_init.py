@@ -0,0 +1,69 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Tests for the lazy imports of the signals subpackage.
+"""
+
+import subprocess
+import sys
+import unittest
+
+from qiskit_dynamics import signals
+
+from ..common import QiskitDynamicsTestCase
+
+PUBLIC_NAMES = [
+    "Signal",
+    "DiscreteSignal",
+    "SignalSum",
+    "DiscreteSignalSum",
+    "SignalList",
+    "Convolution",
+    "Sampler",
+    "IQMixer",
+]
+
+
+class TestSignalsInit(QiskitDynamicsTestCase):
+    """Tests for qiskit_dynamics.signals lazy imports."""
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Imports are eager before python 3.7.")
+    def test_transfer_functions_imported_on_access(self):
+        """Test that transfer_functions is only imported once one of its names is accessed."""
+        code = (
+            "import sys\n"
+            "import qiskit_dynamics.signals as signals\n"
+            "name = 'qiskit_dynamics.signals.transfer_functions'\n"
+            "assert name not in sys.modules\n"
+            "signals.Convolution\n"
+            "assert name in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+    def test_unknown_name(self):
+        """Test that accessing an unknown name raises an AttributeError."""
+        with self.assertRaises(AttributeError):
+            # pylint: disable=no-member,pointless-statement
+            signals.NotASignal
+
+    def test_public_names(self):
+        """Test that __all__ and star imports expose all public names."""
+        self.assertEqual(sorted(signals.__all__), sorted(PUBLIC_NAMES))
+
+        namespace = {}
+        exec("from qiskit_dynamics.signals import *", namespace)  # pylint: disable=exec-used
+        for name in PUBLIC_NAMES:
+            self.assertIs(namespace[name], getattr(signals, name))
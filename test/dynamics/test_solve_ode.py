@@ -14,7 +14,6 @@
 """Tests for solve_ode."""
 
 import numpy as np
-from scipy.linalg import expm
 
 from qiskit import QiskitError
 from qiskit_dynamics import solve_ode
@@ -24,6 +23,21 @@ from qiskit_dynamics.dispatch import Array
 
 from .common import QiskitDynamicsTestCase, TestJaxBase
 
+# Pauli matrices used to build the test generators
+_X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+_Y = np.array([[0.0, -1j], [1j, 0.0]], dtype=complex)
+_Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+
+def _pauli_expm(theta, P):
+    """Compute expm(-1j * theta * P) for an operator P satisfying P @ P = I."""
+    return np.cos(theta) * np.eye(P.shape[0]) - 1j * np.sin(theta) * P
+
+
+def _quad_rhs(t, y):  # pylint: disable=unused-argument
+    """RHS whose solution from y(0) = 0 is t ** 3 / 3."""
+    return Array([t ** 2], dtype=float)
+
 
 class Testsolve_ode_exceptions(QiskitDynamicsTestCase):
     """Test exceptions of solve_ode."""
@@ -41,31 +55,40 @@ class Testsolve_ode_exceptions(QiskitDynamicsTestCase):
 class Testsolve_ode_Base(QiskitDynamicsTestCase):
     """Some reusable routines for testing basic solving functionality."""
 
-    def setUp(self):
-        self.t_span = [0.0, 1.0]
-        self.y0 = Array(np.eye(2, dtype=complex))
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.t_span = [0.0, 1.0]
+        cls.y0 = Array(np.eye(2, dtype=complex))
 
-        self.X = Array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
-        self.Y = Array([[0.0, -1j], [1j, 0.0]], dtype=complex)
-        self.Z = Array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+        cls.X = Array(_X)
+        cls.Y = Array(_Y)
+        cls.Z = Array(_Z)
+
+        # solutions of the basic rhs and _quad_rhs at the end of t_span
+        cls.expected_half_turn_X = _pauli_expm(np.pi, cls.X.data)
+        cls.expected_quad = Array([1.0 / 3])
 
         # simple generator and rhs
+        X = cls.X
+
         # pylint: disable=unused-argument
         def generator(t):
-            return -1j * 2 * np.pi * self.X / 2
+            return -1j * 2 * np.pi * X / 2
 
         def rhs(t, y):
             return generator(t) @ y
 
-        self.basic_generator = generator
-        self.basic_rhs = rhs
+        cls.basic_generator = staticmethod(generator)
+        cls.basic_rhs = staticmethod(rhs)
 
         # define simple model
-        self.w = 2.0
-        self.r = 0.1
-        signals = [self.w, Signal(lambda t: 1.0, self.w)]
-        operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * self.r * self.X / 2]
-        self.basic_model = GeneratorModel(operators=operators, signals=signals)
+        cls.w = 2.0
+        cls.r = 0.1
+        signals = [cls.w, Signal(lambda t: 1.0, cls.w)]
+        operators = [-1j * 2 * np.pi * cls.Z / 2, -1j * 2 * np.pi * cls.r * cls.X / 2]
+        cls.basic_model = GeneratorModel(operators=operators, signals=signals)
 
     def test_solve_ode_w_GeneratorModel(self):
         """Test solve on a GeneratorModel."""
@@ -88,19 +111,12 @@ class Testsolve_ode_Base(QiskitDynamicsTestCase):
             self.basic_rhs, t_span=self.t_span, y0=self.y0, method=method, atol=1e-10, rtol=1e-10
         )
 
-        expected = expm(-1j * np.pi * self.X.data)
-
-        self.assertAllClose(results.y[-1], expected)
-
-        # pylint: disable=unused-argument
-        def quad_rhs(t, y):
-            return Array([t ** 2], dtype=float)
+        self.assertAllClose(results.y[-1], self.expected_half_turn_X)
 
         results = solve_ode(
-            quad_rhs, t_span=[0.0, 1.0], y0=Array([0.0]), method=method, atol=1e-10, rtol=1e-10
+            _quad_rhs, t_span=[0.0, 1.0], y0=Array([0.0]), method=method, atol=1e-10, rtol=1e-10
         )
-        expected = Array([1.0 / 3])
-        self.assertAllClose(results.y[-1], expected)
+        self.assertAllClose(results.y[-1], self.expected_quad)
 
 
 class Testsolve_ode_numpy(Testsolve_ode_Base):
@@ -109,10 +125,9 @@ class Testsolve_ode_numpy(Testsolve_ode_Base):
     def test_standard_problems_solve_ivp(self):
         """Run standard tests for variable step methods in `solve_ivp`."""
 
-        self._variable_step_method_standard_tests("RK45")
-        self._variable_step_method_standard_tests("RK23")
-        self._variable_step_method_standard_tests("BDF")
-        self._variable_step_method_standard_tests("DOP853")
+        for method in ["RK45", "RK23", "BDF", "DOP853"]:
+            with self.subTest(method=method):
+                self._variable_step_method_standard_tests(method)
 
 
 class Testsolve_ode_jax(Testsolve_ode_Base, TestJaxBase):